@@ -0,0 +1,17 @@
+"""Precompiled struct formats shared by the fixture generators.
+
+struct.pack reparses its format string on every call; these compiled
+Struct instances go straight to the packing routine.
+"""
+
+from struct import Struct
+
+U8 = Struct("B")
+U16 = Struct(">H")
+U32 = Struct(">I")
+U64 = Struct(">Q")
+I16 = Struct(">h")
+I32 = Struct(">i")
+RECT = Struct(">iiii")  # top, left, bottom, right
+CHI = Struct(">hI")  # channel ID + data length pair
+HDR = Struct(">4sH6sHIIHH")  # signature through color mode
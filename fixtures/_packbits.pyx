@@ -0,0 +1,49 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython PackBits encoder for fixture generation.
+
+Optional drop-in replacement for the pure-Python encoder in
+generate_fixtures.py. Build in place with:
+
+    cd fixtures && uv run --with cython --with setuptools python setup.py build_ext --inplace
+"""
+
+
+def packbits_encode(const unsigned char[::1] data) -> bytes:
+    """Simple PackBits encoder for fixture generation (Cython)."""
+    cdef Py_ssize_t n = data.shape[0]
+    cdef bytearray out = bytearray(n * 2 + 16)
+    cdef unsigned char[::1] o = out
+    cdef Py_ssize_t i = 0, op = 0, run_len, lit_start, lit_len, j
+    cdef unsigned char run_val, c
+
+    while i < n:
+        # Check for run
+        run_val = data[i]
+        run_len = 1
+        while i + run_len < n and data[i + run_len] == run_val and run_len < 128:
+            run_len += 1
+        if run_len >= 3:
+            o[op] = (257 - run_len) & 0xFF
+            o[op + 1] = run_val
+            op += 2
+            i += run_len
+        else:
+            # Literal
+            lit_start = i
+            lit_len = 0
+            while i + lit_len < n and lit_len < 128:
+                if lit_len > 0 and i + lit_len + 2 < n:
+                    c = data[i + lit_len]
+                    if data[i + lit_len + 1] == c and data[i + lit_len + 2] == c:
+                        break
+                lit_len += 1
+            if lit_len == 0:
+                lit_len = 1
+            o[op] = lit_len - 1
+            op += 1
+            for j in range(lit_len):
+                o[op + j] = data[lit_start + j]
+            op += lit_len
+            i = lit_start + lit_len
+
+    return bytes(out[:op])
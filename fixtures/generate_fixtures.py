@@ -5,40 +5,72 @@ Usage:
     uv run --with psd-tools python fixtures/generate_fixtures.py
 """
 
+import io
 import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from _pack import (
+    CHI as _CHI,
+    HDR as _HDR,
+    I16 as _I16,
+    I32 as _I32,
+    RECT as _RECT,
+    U16 as _U16,
+    U32 as _U32,
+    U64 as _U64,
+)
+
 FIXTURES_DIR = Path(__file__).parent
 
+# Constant channel planes shared across fixtures, precomputed for the
+# common fill values and plane sizes (4x4 and 8x8).
+_PLANE = {(v, n): bytes([v]) * n for v in (0x00, 0x80, 0xFF) for n in (16, 64)}
+
+
+def _plane(val, n):
+    """Constant-fill plane of n bytes; cached for the common fixture sizes."""
+    plane = _PLANE.get((val, n))
+    return plane if plane is not None else bytes([val]) * n
+
 
 def make_header(channels=3, height=1, width=1, depth=8, color_mode=3, version=1):
     """Generate a PSD file header (26 bytes)."""
-    buf = bytearray()
-    buf += b"8BPS"
-    buf += struct.pack(">H", version)
-    buf += b"\x00" * 6
-    buf += struct.pack(">H", channels)
-    buf += struct.pack(">I", height)
-    buf += struct.pack(">I", width)
-    buf += struct.pack(">H", depth)
-    buf += struct.pack(">H", color_mode)
-    return buf
-
-
-def packbits_encode(data: bytes) -> bytes:
-    """Simple PackBits encoder for fixture generation."""
-    result = bytearray()
+    return _HDR.pack(b"8BPS", version, b"\x00" * 6, channels, height, width, depth, color_mode)
+
+
+def _packbits_py(data: bytes) -> bytes:
+    """Simple PackBits encoder for fixture generation (pure Python)."""
+    mv = memoryview(data).cast("B")
+    n = len(mv)
+    # Worst case is 2 output bytes per input byte; preallocate once and
+    # write through an integer cursor instead of growing a bytearray.
+    out = bytearray(n * 2 + 16)
+    op = 0
     i = 0
-    n = len(data)
     while i < n:
         # Check for run
-        run_val = data[i]
+        run_val = mv[i]
         run_len = 1
-        while i + run_len < n and data[i + run_len] == run_val and run_len < 128:
+        # SWAR fast path: XOR 8 bytes at a time against the repeated run byte
+        # and locate the first mismatching byte, instead of walking one byte
+        # per iteration. Dominates on the constant-fill rows fixtures use.
+        pattern = run_val * 0x0101010101010101
+        while i + run_len + 8 <= n and run_len + 8 <= 128:
+            word = int.from_bytes(mv[i + run_len : i + run_len + 8], "little")
+            diff = word ^ pattern
+            if diff == 0:
+                run_len += 8
+                continue
+            run_len += ((diff & -diff).bit_length() - 1) >> 3
+            break
+        while i + run_len < n and mv[i + run_len] == run_val and run_len < 128:
             run_len += 1
         if run_len >= 3:
-            result.append((257 - run_len) & 0xFF)
-            result.append(run_val)
+            out[op] = (257 - run_len) & 0xFF
+            out[op + 1] = run_val
+            op += 2
             i += run_len
         else:
             # Literal
@@ -46,31 +78,132 @@ def packbits_encode(data: bytes) -> bytes:
             lit_len = 0
             while i + lit_len < n and lit_len < 128:
                 if lit_len > 0 and i + lit_len + 2 < n:
-                    c = data[i + lit_len]
-                    if data[i + lit_len + 1] == c and data[i + lit_len + 2] == c:
+                    c = mv[i + lit_len]
+                    if mv[i + lit_len + 1] == c and mv[i + lit_len + 2] == c:
                         break
                 lit_len += 1
             if lit_len == 0:
                 lit_len = 1
-            result.append(lit_len - 1)
-            result.extend(data[lit_start : lit_start + lit_len])
+            out[op] = lit_len - 1
+            op += 1
+            out[op : op + lit_len] = mv[lit_start : lit_start + lit_len]
+            op += lit_len
             i = lit_start + lit_len
-    return bytes(result)
+    del out[op:]
+    return bytes(out)
+
+
+try:
+    # Compiled Cython extension, if built (see setup.py). Fastest option.
+    from _packbits import packbits_encode
+except ImportError:
+    try:
+        import numpy as _np
+        from numba import njit as _njit
+
+        @_njit(cache=True)
+        def _packbits_nb(src, dst):
+            """Numba kernel: encode src (uint8[::1]) into dst, return written length."""
+            n = src.shape[0]
+            i = 0
+            op = 0
+            while i < n:
+                # Check for run
+                run_val = src[i]
+                run_len = 1
+                while i + run_len < n and src[i + run_len] == run_val and run_len < 128:
+                    run_len += 1
+                if run_len >= 3:
+                    dst[op] = (257 - run_len) & 0xFF
+                    dst[op + 1] = run_val
+                    op += 2
+                    i += run_len
+                else:
+                    # Literal
+                    lit_start = i
+                    lit_len = 0
+                    while i + lit_len < n and lit_len < 128:
+                        if lit_len > 0 and i + lit_len + 2 < n:
+                            c = src[i + lit_len]
+                            if src[i + lit_len + 1] == c and src[i + lit_len + 2] == c:
+                                break
+                        lit_len += 1
+                    if lit_len == 0:
+                        lit_len = 1
+                    dst[op] = lit_len - 1
+                    op += 1
+                    for j in range(lit_len):
+                        dst[op + j] = src[lit_start + j]
+                    op += lit_len
+                    i = lit_start + lit_len
+            return op
+
+        def packbits_encode(data: bytes) -> bytes:
+            """Simple PackBits encoder for fixture generation (numba-compiled)."""
+            src = _np.frombuffer(data, dtype=_np.uint8)
+            dst = _np.empty(len(data) * 2 + 16, dtype=_np.uint8)
+            m = _packbits_nb(src, dst)
+            return dst[:m].tobytes()
+
+    except ImportError:
+        packbits_encode = _packbits_py
+
+
+class SectionWriter:
+    """Accumulate PSD bytes in a single BytesIO with patch-back length prefixes.
+
+    Nested length-prefixed sections are built by writing a 4-byte placeholder
+    (begin_len32), writing the section body into the same stream, and patching
+    the placeholder once the section closes (end_len32). This avoids building
+    each section in its own bytearray and re-copying it into the parent.
+    """
+
+    def __init__(self):
+        self.buf = io.BytesIO()
+
+    def write(self, data):
+        self.buf.write(data)
+
+    def u16(self, value):
+        self.buf.write(_U16.pack(value))
+
+    def u32(self, value):
+        self.buf.write(_U32.pack(value))
+
+    def tell(self):
+        return self.buf.tell()
+
+    def begin_len32(self):
+        """Write a 4-byte length placeholder and return its position."""
+        pos = self.buf.tell()
+        self.buf.write(b"\x00\x00\x00\x00")
+        return pos
+
+    def end_len32(self, pos):
+        """Patch the placeholder at pos with the byte count written since."""
+        end = self.buf.tell()
+        self.buf.seek(pos)
+        self.buf.write(_U32.pack(end - pos - 4))
+        self.buf.seek(end)
+
+    def getvalue(self):
+        return self.buf.getvalue()
 
 
 def generate_phase0_minimal():
     """Generate minimal valid PSD: 1x1 RGB 8-bit, Raw compression, black pixel."""
     buf = bytearray()
     buf += make_header()
-    buf += struct.pack(">I", 0)  # Color Mode Data length = 0
-    buf += struct.pack(">I", 0)  # Image Resources length = 0
-    buf += struct.pack(">I", 0)  # Layer and Mask length = 0
-    buf += struct.pack(">H", 0)  # Compression = Raw
+    buf += _U32.pack(0)  # Color Mode Data length = 0
+    buf += _U32.pack(0)  # Image Resources length = 0
+    buf += _U32.pack(0)  # Layer and Mask length = 0
+    buf += _U16.pack(0)  # Compression = Raw
     buf += b"\x00" * 3  # 1px * 3 channels
 
     assert len(buf) == 43, f"Expected 43 bytes, got {len(buf)}"
     output = FIXTURES_DIR / "phase0_minimal.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -78,24 +211,25 @@ def generate_phase1_rle():
     """Generate 1x1 RGB 8-bit PSD with RLE compression."""
     buf = bytearray()
     buf += make_header()
-    buf += struct.pack(">I", 0)  # Color Mode Data
-    buf += struct.pack(">I", 0)  # Image Resources
-    buf += struct.pack(">I", 0)  # Layer and Mask
+    buf += _U32.pack(0)  # Color Mode Data
+    buf += _U32.pack(0)  # Image Resources
+    buf += _U32.pack(0)  # Layer and Mask
 
     # Image Data: RLE compressed
-    buf += struct.pack(">H", 1)  # Compression = RLE
+    buf += _U16.pack(1)  # Compression = RLE
 
     # Byte counts: 3 channels x 1 row = 3 entries
     # Each scanline (1 pixel = 1 byte) encodes to 2 bytes in PackBits
     for _ in range(3):
-        buf += struct.pack(">H", 2)  # byte count = 2
+        buf += _U16.pack(2)  # byte count = 2
 
     # PackBits data: literal 1 byte (control=0x00, data=0x00)
     for _ in range(3):
         buf += b"\x00\x00"
 
     output = FIXTURES_DIR / "phase1_rle.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -103,33 +237,34 @@ def generate_phase2_resources():
     """Generate 1x1 RGB with ResolutionInfo resource block."""
     buf = bytearray()
     buf += make_header()
-    buf += struct.pack(">I", 0)  # Color Mode Data
+    buf += _U32.pack(0)  # Color Mode Data
 
     # Image Resources section
     res_buf = bytearray()
     # Resource block: ResolutionInfo (ID 1005)
     res_buf += b"8BIM"  # Signature
-    res_buf += struct.pack(">H", 1005)  # Resource ID
+    res_buf += _U16.pack(1005)  # Resource ID
     res_buf += b"\x00\x00"  # Name: empty Pascal string (2 bytes)
     # ResolutionInfo data: 16 bytes
     res_data = bytearray()
-    res_data += struct.pack(">I", 0x00480000)  # hRes = 72.0 Fixed16.16
-    res_data += struct.pack(">H", 1)  # hResUnit = pixels/inch
-    res_data += struct.pack(">H", 1)  # widthUnit = inches
-    res_data += struct.pack(">I", 0x00480000)  # vRes = 72.0
-    res_data += struct.pack(">H", 1)  # vResUnit
-    res_data += struct.pack(">H", 1)  # heightUnit
-    res_buf += struct.pack(">I", len(res_data))  # Data length = 16
+    res_data += _U32.pack(0x00480000)  # hRes = 72.0 Fixed16.16
+    res_data += _U16.pack(1)  # hResUnit = pixels/inch
+    res_data += _U16.pack(1)  # widthUnit = inches
+    res_data += _U32.pack(0x00480000)  # vRes = 72.0
+    res_data += _U16.pack(1)  # vResUnit
+    res_data += _U16.pack(1)  # heightUnit
+    res_buf += _U32.pack(len(res_data))  # Data length = 16
     res_buf += res_data
 
-    buf += struct.pack(">I", len(res_buf))  # Resources section length
+    buf += _U32.pack(len(res_buf))  # Resources section length
     buf += res_buf
-    buf += struct.pack(">I", 0)  # Layer and Mask
-    buf += struct.pack(">H", 0)  # Compression = Raw
+    buf += _U32.pack(0)  # Layer and Mask
+    buf += _U16.pack(0)  # Compression = Raw
     buf += b"\x00" * 3  # Pixel data
 
     output = FIXTURES_DIR / "phase2_resources.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -138,61 +273,61 @@ def generate_phase3_single_layer():
     width, height, channels = 4, 4, 3
     buf = bytearray()
     buf += make_header(channels=channels, height=height, width=width)
-    buf += struct.pack(">I", 0)  # Color Mode Data
-    buf += struct.pack(">I", 0)  # Image Resources
+    buf += _U32.pack(0)  # Color Mode Data
+    buf += _U32.pack(0)  # Image Resources
 
     # Layer and Mask Information section
     lm_buf = bytearray()
 
     # Layer Info
     li_buf = bytearray()
-    li_buf += struct.pack(">h", 1)  # Layer count = 1
+    li_buf += _I16.pack(1)  # Layer count = 1
 
     # Layer Record
     lr_buf = bytearray()
-    lr_buf += struct.pack(">i", 0)  # top
-    lr_buf += struct.pack(">i", 0)  # left
-    lr_buf += struct.pack(">i", height)  # bottom
-    lr_buf += struct.pack(">i", width)  # right
-    lr_buf += struct.pack(">H", channels)  # channel count
+    lr_buf += _I32.pack(0)  # top
+    lr_buf += _I32.pack(0)  # left
+    lr_buf += _I32.pack(height)  # bottom
+    lr_buf += _I32.pack(width)  # right
+    lr_buf += _U16.pack(channels)  # channel count
 
     # Channel info: R, G, B
     pixel_bytes = width * height  # 16 bytes per channel
     data_length = 2 + pixel_bytes  # compression (2) + raw data
     for ch_id in range(channels):
-        lr_buf += struct.pack(">h", ch_id)  # channel ID
-        lr_buf += struct.pack(">I", data_length)  # data length
+        lr_buf += _I16.pack(ch_id)  # channel ID
+        lr_buf += _U32.pack(data_length)  # data length
 
     lr_buf += b"8BIM"  # blend signature
     lr_buf += b"norm"  # blend mode
-    lr_buf += struct.pack("B", 255)  # opacity
-    lr_buf += struct.pack("B", 0)  # clipping
-    lr_buf += struct.pack("B", 0x02)  # flags (visible)
+    lr_buf += bytes((255,))  # opacity
+    lr_buf += bytes((0,))  # clipping
+    lr_buf += bytes((0x02,))  # flags (visible)
     lr_buf += b"\x00"  # filler
 
     # Extra data
     extra_buf = bytearray()
-    extra_buf += struct.pack(">I", 0)  # Layer Mask Data length = 0
-    extra_buf += struct.pack(">I", 0)  # Blending Ranges length = 0
+    extra_buf += _U32.pack(0)  # Layer Mask Data length = 0
+    extra_buf += _U32.pack(0)  # Blending Ranges length = 0
     # Layer name: "Layer 0" as Pascal string, padded to 4-byte boundary
     name = b"Layer 0"
-    extra_buf += struct.pack("B", len(name))
+    extra_buf += bytes((len(name),))
     extra_buf += name
     # Pad to 4-byte boundary: 1 + 7 = 8, already aligned
     # No additional layer info
 
-    lr_buf += struct.pack(">I", len(extra_buf))  # extra data length
+    lr_buf += _U32.pack(len(extra_buf))  # extra data length
     lr_buf += extra_buf
 
     li_buf += lr_buf
 
     # Channel Image Data (per layer, per channel)
     for ch in range(channels):
-        li_buf += struct.pack(">H", 0)  # compression = Raw
+        li_buf += _U16.pack(0)  # compression = Raw
         if ch == 0:
-            li_buf += b"\xFF" * pixel_bytes  # R = 255
+            li_buf += _plane(0xFF, pixel_bytes)  # R = 255
         else:
-            li_buf += b"\x00" * pixel_bytes  # G=0, B=0
+            li_buf += bytes(pixel_bytes)  # G=0, B=0 (zero-init, no repeat pass)
 
     # Layer Info length (rounded to even)
     li_length = len(li_buf)
@@ -200,150 +335,162 @@ def generate_phase3_single_layer():
         li_buf += b"\x00"
         li_length += 1
 
-    lm_buf += struct.pack(">I", li_length)
+    lm_buf += _U32.pack(li_length)
     lm_buf += li_buf
 
     # Global Layer Mask Info
-    lm_buf += struct.pack(">I", 0)  # length = 0
+    lm_buf += _U32.pack(0)  # length = 0
 
-    buf += struct.pack(">I", len(lm_buf))  # Section length
+    buf += _U32.pack(len(lm_buf))  # Section length
     buf += lm_buf
 
     # Image Data: Raw, merged (same as layer since single layer)
-    buf += struct.pack(">H", 0)  # Compression = Raw
-    buf += b"\xFF" * pixel_bytes  # R
-    buf += b"\x00" * pixel_bytes  # G
-    buf += b"\x00" * pixel_bytes  # B
+    buf += _U16.pack(0)  # Compression = Raw
+    buf += _plane(0xFF, pixel_bytes)  # R
+    buf += bytes(pixel_bytes * 2)  # G, B
 
     output = FIXTURES_DIR / "phase3_single_layer.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
 def make_layer_record(top, left, bottom, right, channels, blend_mode, opacity, name, channel_data_lengths):
     """Generate a layer record with given parameters."""
-    lr = bytearray()
-    lr += struct.pack(">i", top)
-    lr += struct.pack(">i", left)
-    lr += struct.pack(">i", bottom)
-    lr += struct.pack(">i", right)
-    lr += struct.pack(">H", len(channels))
+    parts = [
+        _RECT.pack(top, left, bottom, right),
+        _U16.pack(len(channels)),
+    ]
 
-    for ch_id, data_length in zip(channels, channel_data_lengths):
-        lr += struct.pack(">h", ch_id)
-        lr += struct.pack(">I", data_length)
+    parts.append(b"".join(
+        _CHI.pack(ch_id, data_length)
+        for ch_id, data_length in zip(channels, channel_data_lengths)
+    ))
 
-    lr += b"8BIM"
-    lr += blend_mode
-    lr += struct.pack("B", opacity)
-    lr += struct.pack("B", 0)  # clipping
-    lr += struct.pack("B", 0x02)  # flags (visible)
-    lr += b"\x00"  # filler
+    parts.append(b"8BIM")
+    parts.append(blend_mode)
+    parts.append(struct.pack("BBBB", opacity, 0, 0x02, 0))  # opacity, clipping, flags (visible), filler
 
-    extra = bytearray()
-    extra += struct.pack(">I", 0)  # mask data length
-    extra += struct.pack(">I", 0)  # blending ranges length
     name_bytes = name.encode("ascii")
-    extra += struct.pack("B", len(name_bytes))
-    extra += name_bytes
-    # Pad to 4-byte boundary
+    # Pad name to 4-byte boundary
     pad = (4 - ((1 + len(name_bytes)) % 4)) % 4
-    extra += b"\x00" * pad
-
-    lr += struct.pack(">I", len(extra))
-    lr += extra
-    return lr
+    extra = b"".join([
+        _U32.pack(0),  # mask data length
+        _U32.pack(0),  # blending ranges length
+        bytes((len(name_bytes),)),
+        name_bytes,
+        b"\x00" * pad,
+    ])
+
+    parts.append(_U32.pack(len(extra)))
+    parts.append(extra)
+    return b"".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _packbits_uniform(val: int, length: int) -> bytes:
+    """PackBits encoding of a constant run; matches packbits_encode output."""
+    out = bytearray()
+    remaining = length
+    while remaining:
+        chunk = min(128, remaining)
+        if chunk >= 3:
+            out.append((257 - chunk) & 0xFF)
+            out.append(val)
+        elif chunk == 2:
+            out += bytes((1, val, val))
+        else:
+            out += bytes((0, val))
+        remaining -= chunk
+    return bytes(out)
 
 
 def make_rle_channel_data(raw_data, height):
     """Encode raw channel data as RLE with byte counts."""
     ch = bytearray()
-    ch += struct.pack(">H", 1)  # compression = RLE
+    ch += _U16.pack(1)  # compression = RLE
     width = len(raw_data) // height
     encoded_rows = []
     for row in range(height):
         row_data = raw_data[row * width : (row + 1) * width]
-        encoded_rows.append(packbits_encode(row_data))
-    # Write byte counts first
-    for enc in encoded_rows:
-        ch += struct.pack(">H", len(enc))
-    # Write compressed data
-    for enc in encoded_rows:
-        ch += enc
+        if row_data and len(set(row_data)) == 1:
+            # Uniform row (the common fixture case): skip the run/literal scanner.
+            encoded_rows.append(_packbits_uniform(row_data[0], len(row_data)))
+        else:
+            encoded_rows.append(packbits_encode(row_data))
+    # Write byte counts first, then the compressed data
+    ch += b"".join(_U16.pack(len(enc)) for enc in encoded_rows)
+    ch += b"".join(encoded_rows)
     return bytes(ch)
 
 
+@lru_cache(maxsize=128)
+def _rle_constant(val: int, width: int, height: int) -> bytes:
+    """RLE channel data for a constant plane, encoded once per (val, w, h)."""
+    return make_rle_channel_data(bytes((val,)) * (width * height), height)
+
+
 def generate_phase4_multi_layer():
     """Generate 8x8 RGB with 2 layers: blue (norm) and red (multiply, 50% opacity), RLE channels."""
     width, height, channels = 8, 8, 3
     pixel_bytes = width * height  # 64
 
-    buf = bytearray()
-    buf += make_header(channels=channels, height=height, width=width)
-    buf += struct.pack(">I", 0)  # Color Mode Data
-    buf += struct.pack(">I", 0)  # Image Resources
+    w = SectionWriter()
+    w.write(make_header(channels=channels, height=height, width=width))
+    w.u32(0)  # Color Mode Data
+    w.u32(0)  # Image Resources
 
-    lm_buf = bytearray()
-    li_buf = bytearray()
-    li_buf += struct.pack(">h", 2)  # Layer count = 2
+    lm_pos = w.begin_len32()  # Layer and Mask section length
+    li_pos = w.begin_len32()  # Layer Info length
+    w.write(_I16.pack(2))  # Layer count = 2
 
     # Layer 0: 8x8, normal, opacity=255, blue (R=0, G=0, B=255)
-    ch_data_0 = []
-    for ch_id in range(3):
-        if ch_id == 2:
-            raw = b"\xFF" * pixel_bytes
-        else:
-            raw = b"\x00" * pixel_bytes
-        ch_data_0.append(make_rle_channel_data(raw, height))
+    # Every channel is a constant plane; the encoded form is shared per value.
+    ch_data_0 = [
+        _rle_constant(0xFF if ch_id == 2 else 0x00, width, height)
+        for ch_id in range(3)
+    ]
 
     lr0 = make_layer_record(
         0, 0, height, width, [0, 1, 2], b"norm", 255, "Layer 0",
         [len(d) for d in ch_data_0],
     )
-    li_buf += lr0
+    w.write(lr0)
 
     # Layer 1: 4x4 at (2,2)-(6,6), multiply, opacity=128, red (R=255, G=0, B=0)
     l1_w, l1_h = 4, 4
-    l1_pixels = l1_w * l1_h  # 16
-    ch_data_1 = []
-    for ch_id in range(3):
-        if ch_id == 0:
-            raw = b"\xFF" * l1_pixels
-        else:
-            raw = b"\x00" * l1_pixels
-        ch_data_1.append(make_rle_channel_data(raw, l1_h))
+    ch_data_1 = [
+        _rle_constant(0xFF if ch_id == 0 else 0x00, l1_w, l1_h)
+        for ch_id in range(3)
+    ]
 
     lr1 = make_layer_record(
         2, 2, 6, 6, [0, 1, 2], b"mul ", 128, "Layer 1",
         [len(d) for d in ch_data_1],
     )
-    li_buf += lr1
+    w.write(lr1)
 
     # Channel Image Data
     for d in ch_data_0:
-        li_buf += d
+        w.write(d)
     for d in ch_data_1:
-        li_buf += d
+        w.write(d)
 
     # Layer Info length (rounded to even)
-    li_length = len(li_buf)
-    if li_length % 2 != 0:
-        li_buf += b"\x00"
-        li_length += 1
-
-    lm_buf += struct.pack(">I", li_length)
-    lm_buf += li_buf
-    lm_buf += struct.pack(">I", 0)  # Global Layer Mask Info
+    if (w.tell() - li_pos) % 2 != 0:
+        w.write(b"\x00")
+    w.end_len32(li_pos)
 
-    buf += struct.pack(">I", len(lm_buf))
-    buf += lm_buf
+    w.u32(0)  # Global Layer Mask Info
+    w.end_len32(lm_pos)
 
     # Merged Image Data: Raw, all black
-    buf += struct.pack(">H", 0)  # Compression = Raw
-    buf += b"\x00" * pixel_bytes * channels
+    w.u16(0)  # Compression = Raw
+    w.write(bytes(pixel_bytes * channels))
 
+    buf = w.getvalue()
     output = FIXTURES_DIR / "phase4_multi_layer.psd"
-    output.write_bytes(bytes(buf))
+    output.write_bytes(buf)
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -351,22 +498,23 @@ def generate_phase5_psb_minimal():
     """Generate minimal valid PSB (version 2): 1x1 RGB 8-bit, Raw compression."""
     buf = bytearray()
     buf += b"8BPS"
-    buf += struct.pack(">H", 2)   # Version = 2 (PSB)
+    buf += _U16.pack(2)   # Version = 2 (PSB)
     buf += b"\x00" * 6            # Reserved
-    buf += struct.pack(">H", 3)   # Channels = 3
-    buf += struct.pack(">I", 1)   # Height = 1
-    buf += struct.pack(">I", 1)   # Width = 1
-    buf += struct.pack(">H", 8)   # Depth = 8
-    buf += struct.pack(">H", 3)   # ColorMode = RGB
-    buf += struct.pack(">I", 0)   # Color Mode Data length = 0
-    buf += struct.pack(">I", 0)   # Image Resources length = 0
-    buf += struct.pack(">Q", 0)   # Layer and Mask length = 0 (UInt64 for PSB)
-    buf += struct.pack(">H", 0)   # Compression = Raw
+    buf += _U16.pack(3)   # Channels = 3
+    buf += _U32.pack(1)   # Height = 1
+    buf += _U32.pack(1)   # Width = 1
+    buf += _U16.pack(8)   # Depth = 8
+    buf += _U16.pack(3)   # ColorMode = RGB
+    buf += _U32.pack(0)   # Color Mode Data length = 0
+    buf += _U32.pack(0)   # Image Resources length = 0
+    buf += _U64.pack(0)   # Layer and Mask length = 0 (UInt64 for PSB)
+    buf += _U16.pack(0)   # Compression = Raw
     buf += b"\x00" * 3            # Pixel data (1px × 3ch)
 
     assert len(buf) == 47, f"Expected 47 bytes, got {len(buf)}"
     output = FIXTURES_DIR / "phase5_psb_minimal.psb"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -374,39 +522,39 @@ def generate_phase7_resources():
     """Generate 1x1 RGB with multiple resource blocks: ResolutionInfo + GlobalAngle + XMP."""
     buf = bytearray()
     buf += make_header()
-    buf += struct.pack(">I", 0)  # Color Mode Data
+    buf += _U32.pack(0)  # Color Mode Data
 
     # Image Resources section
     res_buf = bytearray()
 
     # Resource 1: ResolutionInfo (ID 1005, 16 bytes)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1005)
+    res_buf += _U16.pack(1005)
     res_buf += b"\x00\x00"  # empty Pascal string
     res_data = bytearray()
-    res_data += struct.pack(">I", 0x00480000)  # hRes = 72.0
-    res_data += struct.pack(">H", 1)  # hResUnit
-    res_data += struct.pack(">H", 1)  # widthUnit
-    res_data += struct.pack(">I", 0x00480000)  # vRes = 72.0
-    res_data += struct.pack(">H", 1)  # vResUnit
-    res_data += struct.pack(">H", 1)  # heightUnit
-    res_buf += struct.pack(">I", len(res_data))
+    res_data += _U32.pack(0x00480000)  # hRes = 72.0
+    res_data += _U16.pack(1)  # hResUnit
+    res_data += _U16.pack(1)  # widthUnit
+    res_data += _U32.pack(0x00480000)  # vRes = 72.0
+    res_data += _U16.pack(1)  # vResUnit
+    res_data += _U16.pack(1)  # heightUnit
+    res_buf += _U32.pack(len(res_data))
     res_buf += res_data
 
     # Resource 2: Global Angle (ID 1037, 4 bytes)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1037)
+    res_buf += _U16.pack(1037)
     res_buf += b"\x00\x00"  # empty Pascal string
-    angle_data = struct.pack(">i", 120)
-    res_buf += struct.pack(">I", len(angle_data))
+    angle_data = _I32.pack(120)
+    res_buf += _U32.pack(len(angle_data))
     res_buf += angle_data
 
     # Resource 3: XMP Metadata (ID 1060, variable)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1060)
+    res_buf += _U16.pack(1060)
     res_buf += b"\x00\x00"  # empty Pascal string
     xmp_data = b'<?xml version="1.0"?><x:xmpmeta xmlns:x="adobe:ns:meta/"/>'
-    res_buf += struct.pack(">I", len(xmp_data))
+    res_buf += _U32.pack(len(xmp_data))
     res_buf += xmp_data
     # Pad if odd
     if len(xmp_data) % 2 != 0:
@@ -414,29 +562,35 @@ def generate_phase7_resources():
 
     # Resource 4: Global Altitude (ID 1049, 4 bytes)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1049)
+    res_buf += _U16.pack(1049)
     res_buf += b"\x00\x00"
-    alt_data = struct.pack(">i", 30)
-    res_buf += struct.pack(">I", len(alt_data))
+    alt_data = _I32.pack(30)
+    res_buf += _U32.pack(len(alt_data))
     res_buf += alt_data
 
-    buf += struct.pack(">I", len(res_buf))
+    buf += _U32.pack(len(res_buf))
     buf += res_buf
-    buf += struct.pack(">I", 0)  # Layer and Mask
-    buf += struct.pack(">H", 0)  # Compression = Raw
+    buf += _U32.pack(0)  # Layer and Mask
+    buf += _U16.pack(0)  # Compression = Raw
     buf += b"\x00" * 3  # Pixel data
 
     output = FIXTURES_DIR / "phase7_resources.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
+@lru_cache(maxsize=None)
 def make_ali_block(key: bytes, data: bytes) -> bytes:
-    """Create an Additional Layer Info block with '8BIM' signature."""
+    """Create an Additional Layer Info block with '8BIM' signature.
+
+    Cached: the same small blocks (lsct dividers, luni names) recur across
+    layers and fixtures.
+    """
     buf = bytearray()
     buf += b"8BIM"
     buf += key
-    buf += struct.pack(">I", len(data))
+    buf += _U32.pack(len(data))
     buf += data
     # Pad to even
     if len(data) % 2 != 0:
@@ -444,25 +598,27 @@ def make_ali_block(key: bytes, data: bytes) -> bytes:
     return bytes(buf)
 
 
+@lru_cache(maxsize=None)
 def make_luni_data(name: str) -> bytes:
     """Create 'luni' Unicode layer name data."""
     encoded = name.encode("utf-16-be")
     char_count = len(encoded) // 2
     buf = bytearray()
-    buf += struct.pack(">I", char_count)
+    buf += _U32.pack(char_count)
     buf += encoded
     return bytes(buf)
 
 
+@lru_cache(maxsize=None)
 def make_lsct_data(divider_type: int, blend_mode: bytes = None, sub_type: int = None) -> bytes:
     """Create 'lsct' section divider data."""
     buf = bytearray()
-    buf += struct.pack(">I", divider_type)
+    buf += _U32.pack(divider_type)
     if blend_mode is not None:
         buf += b"8BIM"
         buf += blend_mode
     if sub_type is not None:
-        buf += struct.pack(">I", sub_type)
+        buf += _U32.pack(sub_type)
     return bytes(buf)
 
 
@@ -477,14 +633,14 @@ def generate_phase6_layer_group():
     width, height, channels = 8, 8, 3
     pixel_bytes = width * height  # 64
 
-    buf = bytearray()
-    buf += make_header(channels=channels, height=height, width=width)
-    buf += struct.pack(">I", 0)  # Color Mode Data
-    buf += struct.pack(">I", 0)  # Image Resources
+    w = SectionWriter()
+    w.write(make_header(channels=channels, height=height, width=width))
+    w.u32(0)  # Color Mode Data
+    w.u32(0)  # Image Resources
 
-    lm_buf = bytearray()
-    li_buf = bytearray()
-    li_buf += struct.pack(">h", 3)  # Layer count = 3
+    lm_pos = w.begin_len32()  # Layer and Mask section length
+    li_pos = w.begin_len32()  # Layer Info length
+    w.write(_I16.pack(3))  # Layer count = 3
 
     # Layer 0: bounding section divider (0x0 rect, hidden)
     # ALI: lsct type=3
@@ -495,7 +651,7 @@ def generate_phase6_layer_group():
     for ch_id in range(channels):
         # Empty channel (0x0 rect)
         raw = b""
-        ch_buf = struct.pack(">H", 0)  # compression = Raw
+        ch_buf = _U16.pack(0)  # compression = Raw
         ch_data_0.append(ch_buf)
 
     lr0 = make_layer_record(
@@ -509,33 +665,28 @@ def generate_phase6_layer_group():
     # Custom layer record builder that includes ALI data
     def build_layer_record_with_ali(top, left, bottom, right, ch_ids, blend_mode, opacity, name, channel_data_lengths, ali_data):
         lr = bytearray()
-        lr += struct.pack(">i", top)
-        lr += struct.pack(">i", left)
-        lr += struct.pack(">i", bottom)
-        lr += struct.pack(">i", right)
-        lr += struct.pack(">H", len(ch_ids))
-        for ch_id, dl in zip(ch_ids, channel_data_lengths):
-            lr += struct.pack(">h", ch_id)
-            lr += struct.pack(">I", dl)
+        lr += _RECT.pack(top, left, bottom, right)
+        lr += _U16.pack(len(ch_ids))
+        lr += b"".join(_CHI.pack(ch_id, dl) for ch_id, dl in zip(ch_ids, channel_data_lengths))
         lr += b"8BIM"
         lr += blend_mode
-        lr += struct.pack("B", opacity)
-        lr += struct.pack("B", 0)  # clipping
-        lr += struct.pack("B", 0x02)  # flags (visible)
+        lr += bytes((opacity,))
+        lr += bytes((0,))  # clipping
+        lr += bytes((0x02,))  # flags (visible)
         lr += b"\x00"  # filler
 
         extra = bytearray()
-        extra += struct.pack(">I", 0)  # mask data length
-        extra += struct.pack(">I", 0)  # blending ranges length
+        extra += _U32.pack(0)  # mask data length
+        extra += _U32.pack(0)  # blending ranges length
         name_bytes = name.encode("ascii")
-        extra += struct.pack("B", len(name_bytes))
+        extra += bytes((len(name_bytes),))
         extra += name_bytes
         pad = (4 - ((1 + len(name_bytes)) % 4)) % 4
         extra += b"\x00" * pad
         # Append ALI data
         extra += ali_data
 
-        lr += struct.pack(">I", len(extra))
+        lr += _U32.pack(len(extra))
         lr += extra
         return bytes(lr)
 
@@ -544,62 +695,58 @@ def generate_phase6_layer_group():
         0, 0, 0, 0, [0, 1, 2], b"pass", 255, "</Group 1>",
         [len(d) for d in ch_data_0], lr0_ali,
     )
-    li_buf += lr0
+    w.write(lr0)
 
     # Layer 1: normal layer with luni
     luni_data = make_ali_block(b"luni", make_luni_data("Layer 1"))
     ch_data_1 = []
     for ch_id in range(channels):
-        raw = b"\x80" * pixel_bytes
-        ch_buf = struct.pack(">H", 0) + raw  # compression = Raw + data
+        raw = _plane(0x80, pixel_bytes)
+        ch_buf = _U16.pack(0) + raw  # compression = Raw + data
         ch_data_1.append(ch_buf)
 
     lr1 = build_layer_record_with_ali(
         0, 0, height, width, [0, 1, 2], b"norm", 255, "Layer 1",
         [len(d) for d in ch_data_1], luni_data,
     )
-    li_buf += lr1
+    w.write(lr1)
 
     # Layer 2: open folder "Group 1"
     lsct_open = make_ali_block(b"lsct", make_lsct_data(1, b"pass"))
     ch_data_2 = []
     for ch_id in range(channels):
-        ch_buf = struct.pack(">H", 0)  # compression = Raw, no data (0x0 rect)
+        ch_buf = _U16.pack(0)  # compression = Raw, no data (0x0 rect)
         ch_data_2.append(ch_buf)
 
     lr2 = build_layer_record_with_ali(
         0, 0, 0, 0, [0, 1, 2], b"pass", 255, "Group 1",
         [len(d) for d in ch_data_2], lsct_open,
     )
-    li_buf += lr2
+    w.write(lr2)
 
     # Channel Image Data
     for d in ch_data_0:
-        li_buf += d
+        w.write(d)
     for d in ch_data_1:
-        li_buf += d
+        w.write(d)
     for d in ch_data_2:
-        li_buf += d
+        w.write(d)
 
     # Layer Info length (rounded to even)
-    li_length = len(li_buf)
-    if li_length % 2 != 0:
-        li_buf += b"\x00"
-        li_length += 1
-
-    lm_buf += struct.pack(">I", li_length)
-    lm_buf += li_buf
-    lm_buf += struct.pack(">I", 0)  # Global Layer Mask Info
+    if (w.tell() - li_pos) % 2 != 0:
+        w.write(b"\x00")
+    w.end_len32(li_pos)
 
-    buf += struct.pack(">I", len(lm_buf))
-    buf += lm_buf
+    w.u32(0)  # Global Layer Mask Info
+    w.end_len32(lm_pos)
 
     # Merged Image Data: Raw, all gray
-    buf += struct.pack(">H", 0)  # Compression = Raw
-    buf += b"\x80" * pixel_bytes * channels
+    w.u16(0)  # Compression = Raw
+    w.write(_plane(0x80, pixel_bytes) * channels)
 
+    buf = w.getvalue()
     output = FIXTURES_DIR / "phase6_layer_group.psd"
-    output.write_bytes(bytes(buf))
+    output.write_bytes(buf)
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -609,38 +756,33 @@ def build_layer_record_with_ali_and_mask(
 ):
     """Build a layer record with mask data, blending ranges, and ALI data."""
     lr = bytearray()
-    lr += struct.pack(">i", top)
-    lr += struct.pack(">i", left)
-    lr += struct.pack(">i", bottom)
-    lr += struct.pack(">i", right)
-    lr += struct.pack(">H", len(ch_ids))
-    for ch_id, dl in zip(ch_ids, channel_data_lengths):
-        lr += struct.pack(">h", ch_id)
-        lr += struct.pack(">I", dl)
+    lr += _RECT.pack(top, left, bottom, right)
+    lr += _U16.pack(len(ch_ids))
+    lr += b"".join(_CHI.pack(ch_id, dl) for ch_id, dl in zip(ch_ids, channel_data_lengths))
     lr += b"8BIM"
     lr += blend_mode
-    lr += struct.pack("B", opacity)
-    lr += struct.pack("B", 0)  # clipping
-    lr += struct.pack("B", flags)
+    lr += bytes((opacity,))
+    lr += bytes((0,))  # clipping
+    lr += bytes((flags,))
     lr += b"\x00"  # filler
 
     extra = bytearray()
     # Layer Mask Data
-    extra += struct.pack(">I", len(mask_data))
+    extra += _U32.pack(len(mask_data))
     extra += mask_data
     # Blending Ranges
-    extra += struct.pack(">I", len(blending_ranges))
+    extra += _U32.pack(len(blending_ranges))
     extra += blending_ranges
     # Layer name (Pascal string padded to 4 bytes)
     name_bytes = name.encode("ascii")
-    extra += struct.pack("B", len(name_bytes))
+    extra += bytes((len(name_bytes),))
     extra += name_bytes
     pad = (4 - ((1 + len(name_bytes)) % 4)) % 4
     extra += b"\x00" * pad
     # ALI data
     extra += ali_data
 
-    lr += struct.pack(">I", len(extra))
+    lr += _U32.pack(len(extra))
     lr += extra
     return bytes(lr)
 
@@ -652,21 +794,21 @@ def generate_phase8_structural():
 
     buf = bytearray()
     buf += make_header(channels=channels, height=height, width=width)
-    buf += struct.pack(">I", 0)  # Color Mode Data
-    buf += struct.pack(">I", 0)  # Image Resources
+    buf += _U32.pack(0)  # Color Mode Data
+    buf += _U32.pack(0)  # Image Resources
 
     lm_buf = bytearray()
     li_buf = bytearray()
-    li_buf += struct.pack(">h", 1)  # Layer count = 1
+    li_buf += _I16.pack(1)  # Layer count = 1
 
     # Layer Mask Data (20 bytes): rect(16) + defaultColor(1) + flags(1) + padding(2)
     mask_data = bytearray()
-    mask_data += struct.pack(">i", 0)   # top
-    mask_data += struct.pack(">i", 0)   # left
-    mask_data += struct.pack(">i", 4)   # bottom
-    mask_data += struct.pack(">i", 4)   # right
-    mask_data += struct.pack("B", 255)  # default color
-    mask_data += struct.pack("B", 0x00) # flags
+    mask_data += _I32.pack(0)   # top
+    mask_data += _I32.pack(0)   # left
+    mask_data += _I32.pack(4)   # bottom
+    mask_data += _I32.pack(4)   # right
+    mask_data += bytes((255,))  # default color
+    mask_data += bytes((0x00,)) # flags
     mask_data += b"\x00\x00"            # padding
 
     # Blending Ranges: composite gray (8 bytes) + 3 channels (8 bytes each) = 32 bytes
@@ -683,12 +825,12 @@ def generate_phase8_structural():
     for ch_id in ch_ids:
         if ch_id == -1:
             # Mask channel (4x4 = 16 bytes, all white)
-            raw = b"\xFF" * pixel_bytes
+            raw = _plane(0xFF, pixel_bytes)
         elif ch_id == 0:
-            raw = b"\xFF" * pixel_bytes  # R = 255
+            raw = _plane(0xFF, pixel_bytes)  # R = 255
         else:
-            raw = b"\x00" * pixel_bytes  # G=0, B=0
-        ch_buf = struct.pack(">H", 0) + raw  # compression = Raw + data
+            raw = _plane(0x00, pixel_bytes)  # G=0, B=0
+        ch_buf = _U16.pack(0) + raw  # compression = Raw + data
         ch_data.append(ch_buf)
 
     lr = build_layer_record_with_ali_and_mask(
@@ -709,32 +851,33 @@ def generate_phase8_structural():
         li_buf += b"\x00"
         li_length += 1
 
-    lm_buf += struct.pack(">I", li_length)
+    lm_buf += _U32.pack(li_length)
     lm_buf += li_buf
 
     # Global Layer Mask Info (13 bytes minimum)
     gm_buf = bytearray()
-    gm_buf += struct.pack(">H", 0)        # overlay color space
+    gm_buf += _U16.pack(0)        # overlay color space
     gm_buf += struct.pack(">HHHH", 0, 0, 0, 0)  # color components
-    gm_buf += struct.pack(">H", 100)      # opacity
-    gm_buf += struct.pack("B", 128)       # kind (use stored value)
+    gm_buf += _U16.pack(100)      # opacity
+    gm_buf += bytes((128,))       # kind (use stored value)
     # Pad to even
     if len(gm_buf) % 2 != 0:
         gm_buf += b"\x00"
-    lm_buf += struct.pack(">I", len(gm_buf))
+    lm_buf += _U32.pack(len(gm_buf))
     lm_buf += gm_buf
 
-    buf += struct.pack(">I", len(lm_buf))
+    buf += _U32.pack(len(lm_buf))
     buf += lm_buf
 
     # Merged Image Data: Raw, red pixel
-    buf += struct.pack(">H", 0)  # Compression = Raw
-    buf += b"\xFF" * pixel_bytes  # R
-    buf += b"\x00" * pixel_bytes  # G
-    buf += b"\x00" * pixel_bytes  # B
+    buf += _U16.pack(0)  # Compression = Raw
+    buf += _plane(0xFF, pixel_bytes)  # R
+    buf += _plane(0x00, pixel_bytes)  # G
+    buf += _plane(0x00, pixel_bytes)  # B
 
     output = FIXTURES_DIR / "phase8_structural.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -742,77 +885,78 @@ def generate_phase10_resources():
     """Generate 1x1 RGB with multiple typed resource blocks."""
     buf = bytearray()
     buf += make_header()
-    buf += struct.pack(">I", 0)  # Color Mode Data
+    buf += _U32.pack(0)  # Color Mode Data
 
     res_buf = bytearray()
 
     # ResolutionInfo (ID 1005, 16 bytes)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1005)
+    res_buf += _U16.pack(1005)
     res_buf += b"\x00\x00"
     res_data = bytearray()
-    res_data += struct.pack(">I", 0x00480000)  # hRes = 72.0
-    res_data += struct.pack(">H", 1)           # hResUnit
-    res_data += struct.pack(">H", 1)           # widthUnit
-    res_data += struct.pack(">I", 0x00480000)  # vRes = 72.0
-    res_data += struct.pack(">H", 1)           # vResUnit
-    res_data += struct.pack(">H", 1)           # heightUnit
-    res_buf += struct.pack(">I", len(res_data))
+    res_data += _U32.pack(0x00480000)  # hRes = 72.0
+    res_data += _U16.pack(1)           # hResUnit
+    res_data += _U16.pack(1)           # widthUnit
+    res_data += _U32.pack(0x00480000)  # vRes = 72.0
+    res_data += _U16.pack(1)           # vResUnit
+    res_data += _U16.pack(1)           # heightUnit
+    res_buf += _U32.pack(len(res_data))
     res_buf += res_data
 
     # PrintFlagsInfo (ID 10000, 10 bytes)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 10000)
+    res_buf += _U16.pack(10000)
     res_buf += b"\x00\x00"
     pfi = bytearray()
-    pfi += struct.pack(">H", 0)   # version
-    pfi += struct.pack("B", 1)    # centerCrop
+    pfi += _U16.pack(0)   # version
+    pfi += bytes((1,))    # centerCrop
     pfi += b"\x00"                # padding
-    pfi += struct.pack(">I", 100) # bleedWidth
-    pfi += struct.pack(">H", 1)   # bleedScale
-    res_buf += struct.pack(">I", len(pfi))
+    pfi += _U32.pack(100) # bleedWidth
+    pfi += _U16.pack(1)   # bleedScale
+    res_buf += _U32.pack(len(pfi))
     res_buf += pfi
 
     # VersionInfo (ID 1057)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1057)
+    res_buf += _U16.pack(1057)
     res_buf += b"\x00\x00"
     vi = bytearray()
-    vi += struct.pack(">I", 1)    # version
-    vi += struct.pack("B", 1)     # hasRealMergedData
+    vi += _U32.pack(1)    # version
+    vi += bytes((1,))     # hasRealMergedData
     # writer name as Unicode string
     writer_name = "Adobe Photoshop"
     encoded = writer_name.encode("utf-16-be")
-    vi += struct.pack(">I", len(encoded) // 2)
+    vi += _U32.pack(len(encoded) // 2)
     vi += encoded
     # reader name as Unicode string
     reader_name = ""
-    vi += struct.pack(">I", 0)
-    vi += struct.pack(">I", 1)    # fileVersion
-    vi += struct.pack(">I", 2)    # _reserved (readerVersion)
-    res_buf += struct.pack(">I", len(vi))
+    vi += _U32.pack(0)
+    vi += _U32.pack(1)    # fileVersion
+    vi += _U32.pack(2)    # _reserved (readerVersion)
+    res_buf += _U32.pack(len(vi))
     res_buf += vi
     if len(vi) % 2 != 0:
         res_buf += b"\x00"
 
     # PixelAspectRatio (ID 1064)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1064)
+    res_buf += _U16.pack(1064)
     res_buf += b"\x00\x00"
     par = bytearray()
-    par += struct.pack(">I", 1)          # version
+    par += _U32.pack(1)          # version
     par += struct.pack(">d", 1.0)        # aspect ratio (double)
-    res_buf += struct.pack(">I", len(par))
+    res_buf += _U32.pack(len(par))
     res_buf += par
 
-    buf += struct.pack(">I", len(res_buf))
+    buf += _U32.pack(len(res_buf))
     buf += res_buf
-    buf += struct.pack(">I", 0)  # Layer and Mask
-    buf += struct.pack(">H", 0)  # Compression = Raw
+    buf += _U32.pack(0)  # Layer and Mask
+    buf += _U16.pack(0)  # Compression = Raw
     buf += b"\x00" * 3
 
     output = FIXTURES_DIR / "phase10_resources.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -820,16 +964,16 @@ def generate_phase13_path():
     """Generate 4x4 RGB with a saved path resource (ID 2000)."""
     buf = bytearray()
     buf += make_header(channels=3, height=4, width=4)
-    buf += struct.pack(">I", 0)  # Color Mode Data
+    buf += _U32.pack(0)  # Color Mode Data
 
     res_buf = bytearray()
 
     # Path resource (ID 2000): a simple closed rectangular path
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 2000)
+    res_buf += _U16.pack(2000)
     # Name: "Path 1" as Pascal string
     path_name = b"Path 1"
-    res_buf += struct.pack("B", len(path_name))
+    res_buf += bytes((len(path_name),))
     res_buf += path_name
     # Pad to even
     if (1 + len(path_name)) % 2 != 0:
@@ -839,8 +983,8 @@ def generate_phase13_path():
     path_data = bytearray()
 
     # Record 0: Closed subpath length = 4 (4 knots for a rectangle)
-    path_data += struct.pack(">H", 0)     # type = 0 (ClosedSubpathLength)
-    path_data += struct.pack(">H", 4)     # knot count
+    path_data += _U16.pack(0)     # type = 0 (ClosedSubpathLength)
+    path_data += _U16.pack(4)     # knot count
     path_data += b"\x00" * 22             # padding to 26 bytes
 
     # Fixed-point 8.24: value * 2^24 = value * 16777216
@@ -851,7 +995,7 @@ def generate_phase13_path():
     # Record 1-4: Four corner knots (linked)
     corners = [(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)]
     for y, x in corners:
-        path_data += struct.pack(">H", 1)  # type = 1 (ClosedSubpathBezierKnotLinked)
+        path_data += _U16.pack(1)  # type = 1 (ClosedSubpathBezierKnotLinked)
         # control_preceding (y, x), anchor (y, x), control_leaving (y, x)
         # For straight lines, control points = anchor point
         path_data += struct.pack(">II", fp824(y), fp824(x))  # control preceding
@@ -859,29 +1003,30 @@ def generate_phase13_path():
         path_data += struct.pack(">II", fp824(y), fp824(x))  # control leaving
 
     # Record 5: Initial fill rule = 1
-    path_data += struct.pack(">H", 8)     # type = 8 (InitialFill)
-    path_data += struct.pack(">H", 1)     # fill = 1
+    path_data += _U16.pack(8)     # type = 8 (InitialFill)
+    path_data += _U16.pack(1)     # fill = 1
     path_data += b"\x00" * 22             # padding to 26 bytes
 
-    res_buf += struct.pack(">I", len(path_data))
+    res_buf += _U32.pack(len(path_data))
     res_buf += path_data
 
     # Clipping path name (ID 2999)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 2999)
+    res_buf += _U16.pack(2999)
     res_buf += b"\x00\x00"  # empty Pascal string name
-    clip_data = struct.pack(">I", 0)  # index to path resource (0 = first)
-    res_buf += struct.pack(">I", len(clip_data))
+    clip_data = _U32.pack(0)  # index to path resource (0 = first)
+    res_buf += _U32.pack(len(clip_data))
     res_buf += clip_data
 
-    buf += struct.pack(">I", len(res_buf))
+    buf += _U32.pack(len(res_buf))
     buf += res_buf
-    buf += struct.pack(">I", 0)  # Layer and Mask
-    buf += struct.pack(">H", 0)  # Compression = Raw
+    buf += _U32.pack(0)  # Layer and Mask
+    buf += _U16.pack(0)  # Compression = Raw
     buf += b"\x00" * (3 * 4 * 4)  # 4x4 RGB = 48 bytes
 
     output = FIXTURES_DIR / "phase13_path.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -892,41 +1037,41 @@ def generate_phase15_effects():
 
     buf = bytearray()
     buf += make_header(channels=channels, height=height, width=width)
-    buf += struct.pack(">I", 0)  # Color Mode Data
-    buf += struct.pack(">I", 0)  # Image Resources
+    buf += _U32.pack(0)  # Color Mode Data
+    buf += _U32.pack(0)  # Image Resources
 
     lm_buf = bytearray()
     li_buf = bytearray()
-    li_buf += struct.pack(">h", 1)  # Layer count = 1
+    li_buf += _I16.pack(1)  # Layer count = 1
 
     # Build ALI blocks
     ali = bytearray()
 
     # lrFX (legacy effects): version(2) + count(2) + effects
     lrfx_data = bytearray()
-    lrfx_data += struct.pack(">H", 0)    # version = 0
-    lrfx_data += struct.pack(">H", 1)    # count = 1
+    lrfx_data += _U16.pack(0)    # version = 0
+    lrfx_data += _U16.pack(1)    # count = 1
     # One effect: cmnS (common state)
     lrfx_data += b"8BIM"
     lrfx_data += b"cmnS"
-    lrfx_data += struct.pack(">I", 7)    # effect size
-    lrfx_data += struct.pack(">I", 0)    # version
-    lrfx_data += struct.pack("B", 1)     # visible
-    lrfx_data += struct.pack(">H", 0)    # unused
+    lrfx_data += _U32.pack(7)    # effect size
+    lrfx_data += _U32.pack(0)    # version
+    lrfx_data += bytes((1,))     # visible
+    lrfx_data += _U16.pack(0)    # unused
     ali += make_ali_block(b"lrFX", bytes(lrfx_data))
 
     # FMsk (filter mask): color_space(2) + 4xUInt16 color(8) + opacity(2) = 12 bytes
     fmsk_data = bytearray()
-    fmsk_data += struct.pack(">H", 0)           # color space
+    fmsk_data += _U16.pack(0)           # color space
     fmsk_data += struct.pack(">HHHH", 0, 0, 0, 0)  # color components
-    fmsk_data += struct.pack(">H", 100)         # opacity
+    fmsk_data += _U16.pack(100)         # opacity
     ali += make_ali_block(b"FMsk", bytes(fmsk_data))
 
     # Channel data
     ch_data = []
     for ch_id in range(channels):
-        raw = b"\x80" * pixel_bytes
-        ch_buf = struct.pack(">H", 0) + raw
+        raw = _plane(0x80, pixel_bytes)
+        ch_buf = _U16.pack(0) + raw
         ch_data.append(ch_buf)
 
     lr = build_layer_record_with_ali_and_mask(
@@ -943,18 +1088,19 @@ def generate_phase15_effects():
         li_buf += b"\x00"
         li_length += 1
 
-    lm_buf += struct.pack(">I", li_length)
+    lm_buf += _U32.pack(li_length)
     lm_buf += li_buf
-    lm_buf += struct.pack(">I", 0)  # Global Layer Mask Info
+    lm_buf += _U32.pack(0)  # Global Layer Mask Info
 
-    buf += struct.pack(">I", len(lm_buf))
+    buf += _U32.pack(len(lm_buf))
     buf += lm_buf
 
-    buf += struct.pack(">H", 0)  # Compression = Raw
-    buf += b"\x80" * pixel_bytes * channels
+    buf += _U16.pack(0)  # Compression = Raw
+    buf += _plane(0x80, pixel_bytes) * channels
 
     output = FIXTURES_DIR / "phase15_effects.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
@@ -966,71 +1112,71 @@ def generate_gap_ali_keys():
 
     buf = bytearray()
     buf += make_header(channels=channels, height=height, width=width)
-    buf += struct.pack(">I", 0)  # Color Mode Data
+    buf += _U32.pack(0)  # Color Mode Data
 
     # Image Resources: LayerSelectionIDs (1069) + DocumentIdsSeed (1043)
     res_buf = bytearray()
 
     # Resource 1043: Document IDs Seed (UInt32)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1043)
+    res_buf += _U16.pack(1043)
     res_buf += b"\x00\x00"  # empty Pascal string
-    seed_data = struct.pack(">I", 42)
-    res_buf += struct.pack(">I", len(seed_data))
+    seed_data = _U32.pack(42)
+    res_buf += _U32.pack(len(seed_data))
     res_buf += seed_data
 
     # Resource 1069: Layer Selection IDs (count + array of UInt32)
     res_buf += b"8BIM"
-    res_buf += struct.pack(">H", 1069)
+    res_buf += _U16.pack(1069)
     res_buf += b"\x00\x00"  # empty Pascal string
     sel_data = bytearray()
-    sel_data += struct.pack(">H", 2)   # count = 2
-    sel_data += struct.pack(">I", 1)   # layer ID 1
-    sel_data += struct.pack(">I", 2)   # layer ID 2
-    res_buf += struct.pack(">I", len(sel_data))
+    sel_data += _U16.pack(2)   # count = 2
+    sel_data += _U32.pack(1)   # layer ID 1
+    sel_data += _U32.pack(2)   # layer ID 2
+    res_buf += _U32.pack(len(sel_data))
     res_buf += sel_data
 
-    buf += struct.pack(">I", len(res_buf))
+    buf += _U32.pack(len(res_buf))
     buf += res_buf
 
     # Layer and Mask Information
     lm_buf = bytearray()
     li_buf = bytearray()
-    li_buf += struct.pack(">h", 1)  # Layer count = 1
+    li_buf += _I16.pack(1)  # Layer count = 1
 
     # Build ALI blocks for the layer
     ali = bytearray()
 
     # LMsk (User Mask): color_space(2) + 4xUInt16(8) + opacity(2) + flag(1) = 13 bytes
     lmsk_data = bytearray()
-    lmsk_data += struct.pack(">H", 0)            # color space = 0
+    lmsk_data += _U16.pack(0)            # color space = 0
     lmsk_data += struct.pack(">HHHH", 65535, 0, 0, 0)  # color components (red)
-    lmsk_data += struct.pack(">H", 100)          # opacity = 100
-    lmsk_data += struct.pack("B", 128)           # flag = 128
+    lmsk_data += _U16.pack(100)          # opacity = 100
+    lmsk_data += bytes((128,))           # flag = 128
     ali += make_ali_block(b"LMsk", bytes(lmsk_data))
 
     # brst (Channel Blending Restrictions): array of UInt32
     brst_data = bytearray()
-    brst_data += struct.pack(">I", 0)  # channel 0 (Red)
-    brst_data += struct.pack(">I", 2)  # channel 2 (Blue)
+    brst_data += _U32.pack(0)  # channel 0 (Red)
+    brst_data += _U32.pack(2)  # channel 2 (Blue)
     ali += make_ali_block(b"brst", bytes(brst_data))
 
     # lmgm (Layer Mask as Global Mask): 1 byte + 3 padding
-    lmgm_data = struct.pack("B", 1) + b"\x00\x00\x00"
+    lmgm_data = bytes((1,)) + b"\x00\x00\x00"
     ali += make_ali_block(b"lmgm", bytes(lmgm_data))
 
     # vmgm (Vector Mask as Global Mask): 1 byte + 3 padding
-    vmgm_data = struct.pack("B", 0) + b"\x00\x00\x00"
+    vmgm_data = bytes((0,)) + b"\x00\x00\x00"
     ali += make_ali_block(b"vmgm", bytes(vmgm_data))
 
     # Channel data
     ch_data = []
     for ch_id in range(channels):
         if ch_id == 0:
-            raw = b"\xFF" * pixel_bytes  # R = 255
+            raw = _plane(0xFF, pixel_bytes)  # R = 255
         else:
-            raw = b"\x00" * pixel_bytes
-        ch_buf = struct.pack(">H", 0) + raw  # compression = Raw + data
+            raw = _plane(0x00, pixel_bytes)
+        ch_buf = _U16.pack(0) + raw  # compression = Raw + data
         ch_data.append(ch_buf)
 
     lr = build_layer_record_with_ali_and_mask(
@@ -1047,35 +1193,44 @@ def generate_gap_ali_keys():
         li_buf += b"\x00"
         li_length += 1
 
-    lm_buf += struct.pack(">I", li_length)
+    lm_buf += _U32.pack(li_length)
     lm_buf += li_buf
-    lm_buf += struct.pack(">I", 0)  # Global Layer Mask Info
+    lm_buf += _U32.pack(0)  # Global Layer Mask Info
 
-    buf += struct.pack(">I", len(lm_buf))
+    buf += _U32.pack(len(lm_buf))
     buf += lm_buf
 
-    buf += struct.pack(">H", 0)  # Compression = Raw
-    buf += b"\xFF" * pixel_bytes  # R
-    buf += b"\x00" * pixel_bytes  # G
-    buf += b"\x00" * pixel_bytes  # B
+    buf += _U16.pack(0)  # Compression = Raw
+    buf += _plane(0xFF, pixel_bytes)  # R
+    buf += _plane(0x00, pixel_bytes)  # G
+    buf += _plane(0x00, pixel_bytes)  # B
 
     output = FIXTURES_DIR / "gap_ali_keys.psd"
-    output.write_bytes(bytes(buf))
+    with open(output, "wb") as f:
+        f.write(buf)  # buffer protocol: no bytes() copy
     print(f"Generated {output} ({len(buf)} bytes)")
 
 
+GENERATORS = [
+    generate_phase0_minimal,
+    generate_phase1_rle,
+    generate_phase2_resources,
+    generate_phase3_single_layer,
+    generate_phase4_multi_layer,
+    generate_phase5_psb_minimal,
+    generate_phase6_layer_group,
+    generate_phase7_resources,
+    generate_phase8_structural,
+    generate_phase10_resources,
+    generate_phase13_path,
+    generate_phase15_effects,
+    generate_gap_ali_keys,
+]
+
+
 if __name__ == "__main__":
-    generate_phase0_minimal()
-    generate_phase1_rle()
-    generate_phase2_resources()
-    generate_phase3_single_layer()
-    generate_phase4_multi_layer()
-    generate_phase5_psb_minimal()
-    generate_phase6_layer_group()
-    generate_phase7_resources()
-    generate_phase8_structural()
-    generate_phase10_resources()
-    generate_phase13_path()
-    generate_phase15_effects()
-    generate_gap_ali_keys()
+    # Each generator writes its own file; run them across processes.
+    with ProcessPoolExecutor() as ex:
+        for future in [ex.submit(fn) for fn in GENERATORS]:
+            future.result()
     print("All fixtures generated.")
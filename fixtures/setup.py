@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""Build the optional Cython PackBits extension in place.
+
+Usage:
+    cd fixtures && uv run --with cython --with setuptools python setup.py build_ext --inplace
+
+generate_fixtures.py picks the extension up automatically when present
+and falls back to the pure-Python encoder otherwise.
+"""
+
+from setuptools import Extension, setup
+
+from Cython.Build import cythonize
+
+setup(
+    name="psd-fixture-packbits",
+    ext_modules=cythonize(
+        [Extension("_packbits", ["_packbits.pyx"], extra_compile_args=["-O3"])],
+    ),
+)
@@ -4,29 +4,61 @@
 Usage:
     uv run --with psd-tools python scripts/verify.py validate [fixtures/...]
     uv run --with psd-tools python scripts/verify.py validate  # validates all fixtures
+    python scripts/verify.py validate --fast  # header-only check, no psd-tools
 """
 
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+_HDR = struct.Struct(">4sH6sHIIHH")
 
-def validate_file(filepath: Path) -> bool:
-    """Validate a single PSD file using psd-tools."""
+
+def validate_file(filepath: Path) -> tuple[bool, str]:
+    """Validate a single PSD file using psd-tools.
+
+    Returns (ok, report) so results can be collected from worker processes
+    and printed in input order.
+    """
     from psd_tools import PSDImage
 
     try:
         psd = PSDImage.open(filepath)
-        print(f"  OK: {filepath}")
-        print(f"      Size: {psd.width}x{psd.height}, Channels: {psd.channels}")
-        print(f"      Color Mode: {psd.color_mode}, Depth: {psd.depth}")
-        return True
+        report = (
+            f"  OK: {filepath}\n"
+            f"      Size: {psd.width}x{psd.height}, Channels: {psd.channels}\n"
+            f"      Color Mode: {psd.color_mode}, Depth: {psd.depth}"
+        )
+        return True, report
     except Exception as e:
-        print(f"  FAIL: {filepath}")
-        print(f"        {e}")
-        return False
+        return False, f"  FAIL: {filepath}\n        {e}"
+
 
+def validate_header_only(filepath: Path) -> tuple[bool, str]:
+    """Validate only the 26-byte header.
 
-def validate(paths: list[str]) -> int:
+    Everything the full validation prints lives in the header, so the fast
+    path skips the psd-tools decode (and the psd-tools dependency) entirely.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            sig, version, _, channels, height, width, depth, color_mode = _HDR.unpack(f.read(26))
+        if sig != b"8BPS":
+            return False, f"  FAIL: {filepath}\n        bad signature: {sig!r}"
+        if version not in (1, 2):
+            return False, f"  FAIL: {filepath}\n        bad version: {version}"
+        report = (
+            f"  OK: {filepath}\n"
+            f"      Size: {width}x{height}, Channels: {channels}\n"
+            f"      Color Mode: {color_mode}, Depth: {depth}"
+        )
+        return True, report
+    except Exception as e:
+        return False, f"  FAIL: {filepath}\n        {e}"
+
+
+def validate(paths: list[str], fast: bool = False) -> int:
     """Validate PSD files."""
     fixtures_dir = Path(__file__).parent.parent / "fixtures"
 
@@ -40,22 +72,34 @@ def validate(paths: list[str]) -> int:
         files = [Path(p) for p in paths]
 
     print(f"Validating {len(files)} file(s)...")
-    results = [validate_file(f) for f in files]
+    if fast:
+        results = [validate_header_only(f) for f in files]
+    else:
+        # Parsing is CPU-bound in psd-tools; validate files across processes.
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(validate_file, files))
+    for _, report in results:
+        print(report)
 
-    passed = sum(results)
+    passed = sum(ok for ok, _ in results)
     failed = len(results) - passed
     print(f"\nResults: {passed} passed, {failed} failed")
     return 0 if failed == 0 else 1
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/verify.py validate [files...]")
+    args = sys.argv[1:]
+    fast = "--fast" in args
+    if fast:
+        args.remove("--fast")
+
+    if not args:
+        print("Usage: python scripts/verify.py validate [--fast] [files...]")
         sys.exit(1)
 
-    command = sys.argv[1]
+    command = args[0]
     if command == "validate":
-        sys.exit(validate(sys.argv[2:]))
+        sys.exit(validate(args[1:], fast=fast))
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
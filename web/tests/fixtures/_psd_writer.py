@@ -0,0 +1,213 @@
+"""Shared PSD serialization for the web test fixture generators.
+
+The generator scripts only declare their LAYERS lists; the layer-record,
+channel-data, and composite serialization all live here so optimizations
+land once. Layers are given bottom-to-top; group markers are dicts with
+"divider" 1 (open) / 3 (close) and no color.
+"""
+
+import hashlib
+import json
+import os
+import struct
+
+import numpy as np
+
+# Bump when the serializer's output changes, to invalidate existing stamps.
+_WRITER_VERSION = 1
+
+# Precompiled struct formats: skips per-call format parsing in the hot loops.
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_I16 = struct.Struct(">h")
+_HDR = struct.Struct(">4sH6sHIIHH")  # signature through color mode
+# Whole fixed-size layer record prefix in one pack: rect, channel count,
+# 4 channel-info pairs, 8BIM/norm, opacity/clipping/flags/filler,
+# extra length, mask + blending-range lengths, name length.
+_LAYER_HDR = struct.Struct(">IIII H hI hI hI hI 4s 4s BBBx I II B")
+
+try:
+    # Optional: JIT the blend with row-parallel loops when numba is available.
+    from numba import njit as _njit, prange as _prange
+
+    @_njit(cache=True, parallel=True)
+    def blend_rect(comp, x0, y0, x1, y1, r, g, b, ai):
+        for py in _prange(y0, y1):
+            for px in range(x0, x1):
+                comp[py, px, 0] = (r * ai + comp[py, px, 0] * (256 - ai) + 128) >> 8
+                comp[py, px, 1] = (g * ai + comp[py, px, 1] * (256 - ai) + 128) >> 8
+                comp[py, px, 2] = (b * ai + comp[py, px, 2] * (256 - ai) + 128) >> 8
+                comp[py, px, 3] = 255
+except ImportError:
+    def blend_rect(comp, x0, y0, x1, y1, r, g, b, ai):
+        region = comp[y0:y1, x0:x1, :3].astype(np.uint16)
+        src = np.array([r, g, b], dtype=np.uint16)
+        comp[y0:y1, x0:x1, :3] = ((src * ai + region * (256 - ai) + 128) >> 8).astype(np.uint8)
+        comp[y0:y1, x0:x1, 3] = 255
+
+
+def fixture_key(layers: list, W: int, H: int) -> str:
+    """Content hash of everything the output bytes depend on."""
+    blob = json.dumps(
+        {"layers": layers, "W": W, "H": H, "v": _WRITER_VERSION}, sort_keys=True
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def write_stamped(out, layers: list, W: int, H: int) -> None:
+    """Build and write the PSD unless its stamp sidecar is already current.
+
+    The stamp (<name>.psd.sha256) records the fixture_key of the last
+    write, so unchanged LAYERS cost neither the build nor the disk write.
+    """
+    key = fixture_key(layers, W, H)
+    stamp = out.with_suffix(".psd.sha256")
+    if out.exists() and stamp.exists() and stamp.read_text().strip() == key:
+        print(f"{out} up to date")
+        return
+    buf = build_psd(layers, (W, H), compute_composite(layers, W, H))
+    write_file(out, buf)
+    stamp.write_text(key)
+    print(f"Generated {out} ({len(buf)} bytes)")
+
+
+def write_file(path, buf) -> None:
+    """Write the finished buffer as a single write(2), skipping buffered IO."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, buf)
+    finally:
+        os.close(fd)
+
+
+def make_lsct(divider_type: int) -> bytes:
+    """Build an lsct (Section Divider Setting) ALI block."""
+    data = _U32.pack(divider_type)
+    return b"8BIM" + b"lsct" + _U32.pack(len(data)) + data
+
+
+def compute_composite(layers: list, W: int, H: int) -> np.ndarray:
+    """Blend the effectively visible layers onto white, bottom-to-top.
+
+    A layer renders only if neither it nor any enclosing group is hidden,
+    so the markers are walked top-to-bottom first (the open marker, which
+    carries the group's visibility, is stored above its members).
+    """
+    visible = []
+    group_hidden = []
+    for layer in reversed(layers):
+        divider = layer.get("divider")
+        if divider == 1:
+            group_hidden.append(bool(layer.get("hidden")))
+            visible.append(False)
+        elif divider == 3:
+            group_hidden.pop()
+            visible.append(False)
+        else:
+            visible.append(not layer.get("hidden") and not any(group_hidden))
+    visible.reverse()
+
+    composite = np.full((H, W, 4), 255, dtype=np.uint8)
+    for layer, vis in zip(layers, visible):
+        if not vis or layer.get("color") is None:
+            continue
+        x, y, w_l, h_l = layer["x"], layer["y"], layer["w"], layer["h"]
+        r, g, b, a = layer["color"]
+        # Integer alpha in 0..256: out = (src*ai + dst*(256-ai) + 128) >> 8
+        ai = int(round((a / 255.0) * (layer["opacity"] / 255.0) * 256))
+        # Clamp once up front; a negative offset would otherwise wrap
+        # around as a slice index.
+        y0, y1 = max(y, 0), min(y + h_l, H)
+        x0, x1 = max(x, 0), min(x + w_l, W)
+        if ai == 256:
+            # Fully opaque: a broadcast fill, no blend needed.
+            composite[y0:y1, x0:x1] = (r, g, b, 255)
+        else:
+            blend_rect(composite, x0, y0, x1, y1, r, g, b, ai)
+    return composite
+
+
+def build_psd(layers: list, size: tuple, composite: np.ndarray) -> bytearray:
+    """Serialize header, layer section, and composite into one PSD buffer.
+
+    The layer section is data-dependent, so it is joined from chunks; the
+    final buffer length is then known exactly and assembled into a single
+    preallocated bytearray with no growth copies.
+    """
+    W, H = size
+
+    # === Layer and Mask Information ===
+    layer_parts = [_I16.pack(len(layers))]
+
+    # Layer records
+    for layer in layers:
+        x, y, w, h_l = layer["x"], layer["y"], layer["w"], layer["h"]
+        # Real layers carry pixels; dividers carry just the compression marker.
+        ch_len = w * h_l + 2 if layer.get("color") is not None else 2
+        # flags: bit 1 = not visible
+        flags = 2 if layer.get("hidden") else 0
+
+        name_bytes = layer["name"].encode("ascii")
+        # Pascal string (length byte + name) zero-padded to a 4-byte
+        # boundary; the length byte itself is packed by _LAYER_HDR.
+        pascal_padded = (1 + len(name_bytes) + 3) & ~3
+
+        ali_data = b""
+        if layer.get("divider") is not None:
+            ali_data = make_lsct(layer["divider"])
+
+        extra_len = 4 + 4 + pascal_padded + len(ali_data)
+        layer_parts.append(_LAYER_HDR.pack(
+            y, x, y + h_l, x + w, 4,
+            -1, ch_len, 0, ch_len, 1, ch_len, 2, ch_len,
+            b"8BIM", b"norm", layer["opacity"], 0, flags,
+            extra_len, 0, 0, len(name_bytes),
+        ))
+        layer_parts.append(name_bytes.ljust(pascal_padded - 1, b"\x00"))
+        layer_parts.append(ali_data)
+
+    # Channel image data
+    for layer in layers:
+        if layer.get("color") is not None:
+            r, g, b, a = layer["color"]
+            pixel_count = layer["w"] * layer["h"]
+            for ch_val in [a, r, g, b]:  # Alpha, R, G, B
+                layer_parts.append(_U16.pack(0))  # Raw compression
+                layer_parts.append(bytes((ch_val,)) * pixel_count)
+        else:
+            # Empty channels for divider layers
+            for _ in range(4):
+                layer_parts.append(_U16.pack(0))
+
+    # Wrap layer section
+    layer_section = b"".join(layer_parts)
+    layer_info = _U32.pack(len(layer_section)) + layer_section
+    if len(layer_info) % 2 != 0:
+        layer_info += b"\x00"
+
+    # === Image Data (Section 5) - Composite ===
+    # The composite must stay visually correct: the web specs
+    # (grouped.spec.ts, hidden-group.spec.ts) pixel-compare the GPU
+    # recomposite against this section, so it cannot be stubbed out.
+    # R, G, B, A planar, copied straight out of the ndarray buffer.
+    planes = np.ascontiguousarray(composite.transpose(2, 0, 1))
+
+    # header + empty sections + layer-info length + layer info
+    # + compression marker + composite planes
+    total = 26 + 8 + 4 + len(layer_info) + 2 + planes.nbytes
+    out = bytearray(total)
+    mv = memoryview(out)
+    off = 0
+    for chunk in (
+        _HDR.pack(b"8BPS", 1, b"\x00" * 6, 4, H, W, 8, 3),
+        b"\x00" * 8,  # empty Color Mode Data + Image Resources
+        _U32.pack(len(layer_info)),
+        layer_info,
+        _U16.pack(0),  # Raw compression
+    ):
+        end = off + len(chunk)
+        mv[off:end] = chunk
+        off = end
+    mv[off:] = planes.data.cast("B")
+
+    return out
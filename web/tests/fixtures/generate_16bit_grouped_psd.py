@@ -5,17 +5,28 @@ In 16-bit PSD files, Photoshop stores layer data in a Lr16 global ALI block
 rather than the regular layer_info section. This tests that code path.
 
 Usage:
-    python3 web/tests/fixtures/generate_16bit_grouped_psd.py
+    uv run --with numpy python web/tests/fixtures/generate_16bit_grouped_psd.py
 """
 
+import os
 import struct
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 OUT = Path(__file__).parent / "test-16bit-grouped.psd"
 
 W, H = 64, 64
 DEPTH = 16  # 16-bit
 
+# Precompiled struct formats: skips per-call format parsing in the hot loops.
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_I16 = struct.Struct(">h")
+_RECT = struct.Struct(">IIII")  # top, left, bottom, right
+_CHINFO = struct.Struct(">hI")  # channel ID + data length pair
+
 # PSD layers bottom-to-top:
 #   [0] Blue (flat)
 #   [1] Section divider type 3 (group end marker)
@@ -37,44 +48,68 @@ LAYERS = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _const_plane16(val16: int, pixel_count: int) -> bytes:
+    """Big-endian uint16 constant plane, built once per (value, size)."""
+    return val16.to_bytes(2, "big") * pixel_count
+
+
 def make_lsct(divider_type: int) -> bytes:
     """Build an lsct (Section Divider Setting) ALI block."""
-    data = struct.pack(">I", divider_type)
-    block = b"8BIM" + b"lsct" + struct.pack(">I", len(data)) + data
+    data = _U32.pack(divider_type)
+    block = b"8BIM" + b"lsct" + _U32.pack(len(data)) + data
     return block
 
 
 def build_layer_section(depth: int) -> bytes:
-    """Build the layer info section (layer records + channel data)."""
-    section = bytearray()
-    section += struct.pack(">h", len(LAYERS))
+    """Build the layer info section (layer records + channel data).
+
+    Serializes cursor-style into one preallocated buffer — the same write
+    pattern a compiled serializer would use — kept in pure Python since this
+    script runs standalone via ``uv run`` with no build step.
+    """
+    bytes_per_sample = depth // 8  # 2 for 16-bit
+
+    # Upper bound: per-layer record overhead plus four channel planes.
+    est = 2
+    for layer in LAYERS:
+        est += 128 + len(layer["name"])
+        est += 4 * (2 + layer["w"] * layer["h"] * bytes_per_sample)
+    out = bytearray(est)
+    off = 0
+
+    def put(chunk: bytes) -> None:
+        nonlocal off
+        end = off + len(chunk)
+        out[off:end] = chunk
+        off = end
+
+    put(_I16.pack(len(LAYERS)))
 
     # Layer records
     for layer in LAYERS:
         x, y, w, h_l = layer["x"], layer["y"], layer["w"], layer["h"]
-        section += struct.pack(">IIII", y, x, y + h_l, x + w)
+        put(_RECT.pack(y, x, y + h_l, x + w))
 
         pixel_count = w * h_l
-        bytes_per_sample = depth // 8  # 2 for 16-bit
 
+        put(_U16.pack(4))
         if layer["color"] is not None:
-            section += struct.pack(">H", 4)
             for ch_id in [-1, 0, 1, 2]:
                 # channel data length: 2 (compression) + pixel_count * bytes_per_sample
                 ch_data_len = 2 + pixel_count * bytes_per_sample
-                section += struct.pack(">hI", ch_id, ch_data_len)
+                put(_CHINFO.pack(ch_id, ch_data_len))
         else:
-            section += struct.pack(">H", 4)
             for ch_id in [-1, 0, 1, 2]:
-                section += struct.pack(">hI", ch_id, 2)
+                put(_CHINFO.pack(ch_id, 2))
 
-        section += b"8BIM"
-        section += b"norm"
-        section += struct.pack(">B", layer["opacity"])
-        section += struct.pack(">B", 0)
+        put(b"8BIM")
+        put(b"norm")
+        put(bytes((layer["opacity"],)))
+        put(b"\x00")  # clipping
         flags = 2 if layer["divider"] == 3 else 0
-        section += struct.pack(">B", flags)
-        section += b"\x00"
+        put(bytes((flags,)))
+        put(b"\x00")
 
         name_bytes = layer["name"].encode("ascii")
         pascal_len = 1 + len(name_bytes)
@@ -85,33 +120,30 @@ def build_layer_section(depth: int) -> bytes:
             ali_data = make_lsct(layer["divider"])
 
         extra_len = 4 + 4 + pascal_padded + len(ali_data)
-        section += struct.pack(">I", extra_len)
-        section += struct.pack(">I", 0)
-        section += struct.pack(">I", 0)
-        section += struct.pack(">B", len(name_bytes))
-        section += name_bytes
-        section += b"\x00" * (pascal_padded - pascal_len)
-        section += ali_data
+        put(_U32.pack(extra_len))
+        put(_U32.pack(0))
+        put(_U32.pack(0))
+        put(bytes((len(name_bytes),)))
+        put(name_bytes)
+        put(b"\x00" * (pascal_padded - pascal_len))
+        put(ali_data)
 
     # Channel image data (16-bit samples)
     for layer in LAYERS:
-        w_l, h_l = layer["x"], layer["y"]  # Unused, get from dict
         w_l, h_l = layer["w"], layer["h"]
 
         if layer["color"] is not None:
             r, g, b, a = layer["color"]
             pixel_count = w_l * h_l
             for ch_val in [a, r, g, b]:
-                section += struct.pack(">H", 0)  # Raw compression
+                put(_U16.pack(0))  # Raw compression
                 # 16-bit samples: scale 0-255 to 0-65535
-                val16 = ch_val * 257  # e.g. 255 * 257 = 65535
-                for _ in range(pixel_count):
-                    section += struct.pack(">H", val16)
+                put(_const_plane16(ch_val * 257, pixel_count))
         else:
             for _ in range(4):
-                section += struct.pack(">H", 0)
+                put(_U16.pack(0))
 
-    return bytes(section)
+    return bytes(out[:off])
 
 
 def main():
@@ -119,19 +151,19 @@ def main():
 
     # === Header (26 bytes) ===
     buf += b"8BPS"
-    buf += struct.pack(">H", 1)  # version
+    buf += _U16.pack(1)  # version
     buf += b"\x00" * 6
-    buf += struct.pack(">H", 4)  # channels (RGBA)
-    buf += struct.pack(">I", H)
-    buf += struct.pack(">I", W)
-    buf += struct.pack(">H", DEPTH)  # 16-bit
-    buf += struct.pack(">H", 3)  # RGB
+    buf += _U16.pack(4)  # channels (RGBA)
+    buf += _U32.pack(H)
+    buf += _U32.pack(W)
+    buf += _U16.pack(DEPTH)  # 16-bit
+    buf += _U16.pack(3)  # RGB
 
     # === Color Mode Data ===
-    buf += struct.pack(">I", 0)
+    buf += _U32.pack(0)
 
     # === Image Resources ===
-    buf += struct.pack(">I", 0)
+    buf += _U32.pack(0)
 
     # === Layer and Mask Information ===
     # For 16-bit PSD: layer_info section is EMPTY, layers are in Lr16 ALI block
@@ -139,7 +171,7 @@ def main():
     layer_data = build_layer_section(DEPTH)
 
     # Build Lr16 ALI block
-    lr16_ali = b"8BIM" + b"Lr16" + struct.pack(">I", len(layer_data)) + layer_data
+    lr16_ali = b"8BIM" + b"Lr16" + _U32.pack(len(layer_data)) + layer_data
     # Pad to even
     if len(lr16_ali) % 2 != 0:
         lr16_ali += b"\x00"
@@ -149,17 +181,18 @@ def main():
     #   global_mask_info = none
     #   additional_layer_info = [Lr16 block]
     lam_content = bytearray()
-    lam_content += struct.pack(">I", 0)  # layer_info_length = 0 (empty)
+    lam_content += _U32.pack(0)  # layer_info_length = 0 (empty)
     # Global layer mask info (length = 0)
-    lam_content += struct.pack(">I", 0)
+    lam_content += _U32.pack(0)
     # Lr16 ALI block
     lam_content += lr16_ali
 
-    buf += struct.pack(">I", len(lam_content))
+    buf += _U32.pack(len(lam_content))
     buf += lam_content
 
     # === Image Data (Section 5) - Composite (16-bit) ===
-    composite = [[[255, 255, 255, 255] for _ in range(W)] for _ in range(H)]
+    # White background, alpha-blended per layer as a vectorized slice update.
+    composite = np.full((H, W, 4), 255, dtype=np.uint8)
 
     visual_order = [
         LAYERS[0],  # Blue (flat)
@@ -173,25 +206,27 @@ def main():
         x, y, w_l, h_l = layer["x"], layer["y"], layer["w"], layer["h"]
         r, g, b, a = layer["color"]
         alpha = (a / 255.0) * (layer["opacity"] / 255.0)
-        for py in range(y, min(y + h_l, H)):
-            for px in range(x, min(x + w_l, W)):
-                dst = composite[py][px]
-                composite[py][px] = [
-                    int(r * alpha + dst[0] * (1 - alpha)),
-                    int(g * alpha + dst[1] * (1 - alpha)),
-                    int(b * alpha + dst[2] * (1 - alpha)),
-                    255,
-                ]
-
-    buf += struct.pack(">H", 0)  # Raw compression
-    for ch in range(4):  # R, G, B, A planar
-        for y in range(H):
-            for x in range(W):
-                val = composite[y][x][ch]
-                val16 = val * 257  # scale to 16-bit
-                buf += struct.pack(">H", val16)
-
-    OUT.write_bytes(buf)
+        # Clamp once up front; a negative offset would otherwise wrap
+        # around as a slice index.
+        y0, y1 = max(y, 0), min(y + h_l, H)
+        x0, x1 = max(x, 0), min(x + w_l, W)
+        region = composite[y0:y1, x0:x1, :3].astype(np.float64)
+        src = np.array([r, g, b], dtype=np.float64)
+        composite[y0:y1, x0:x1, :3] = (src * alpha + region * (1 - alpha)).astype(np.uint8)
+        composite[y0:y1, x0:x1, 3] = 255
+
+    buf += _U16.pack(0)  # Raw compression
+    # Scale 0-255 to 0-65535 and emit R, G, B, A planar as big-endian uint16
+    # in one shot instead of one struct.pack per sample.
+    planar = np.ascontiguousarray((composite.astype(np.uint16) * 257).transpose(2, 0, 1))
+    buf += planar.astype(">u2").tobytes()
+
+    # Single write(2) of the finished buffer, skipping buffered IO
+    fd = os.open(str(OUT), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, buf)
+    finally:
+        os.close(fd)
     print(f"Generated {OUT} ({len(buf)} bytes)")
 
 
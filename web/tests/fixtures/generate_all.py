@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Regenerate every web test fixture, one process per generator.
+
+The generators write disjoint files, so they parallelize trivially.
+
+Usage:
+    uv run --with numpy python web/tests/fixtures/generate_all.py
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import generate_16bit_grouped_psd
+import generate_grouped_psd
+import generate_hidden_group_psd
+import generate_test_psd
+
+GENERATORS = [
+    generate_test_psd.main,
+    generate_grouped_psd.main,
+    generate_hidden_group_psd.main,
+    generate_16bit_grouped_psd.main,
+]
+
+
+if __name__ == "__main__":
+    with ProcessPoolExecutor(max_workers=len(GENERATORS)) as ex:
+        futures = [ex.submit(fn) for fn in GENERATORS]
+        for future in futures:
+            future.result()